@@ -1,19 +1,57 @@
 import urllib.request
+import urllib.error
 import json
+import os
 from pathlib import Path
 
+CONTEXT_DIR = Path("context")
+HTML_PATH = CONTEXT_DIR / "gradio_6_raw.html"
+ETAG_PATH = CONTEXT_DIR / "gradio_6_raw.etag"
+LASTMOD_PATH = CONTEXT_DIR / "gradio_6_raw.lastmod"
+
+def _read_sidecar(path):
+    return path.read_text(encoding='utf-8').strip() if path.exists() else ""
+
+def _write_atomic(path, text):
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(text)
+    os.replace(tmp_path, path)
+
 def extract_gradio_html():
     url = "https://www.gradio.app/main/guides/gradio-6-migration-guide"
-    
-    with urllib.request.urlopen(url) as response:
-        html = response.read().decode('utf-8')
-    
-    # Save raw HTML
-    Path("context").mkdir(exist_ok=True)
-    with open("context/gradio_6_raw.html", 'w', encoding='utf-8') as f:
-        f.write(html)
-    
-    print(f"Extracted HTML: {len(html)} characters saved to context/gradio_6_raw.html")
+
+    # Only send validators when we still have the cached body to fall back on
+    headers = {}
+    if HTML_PATH.exists():
+        etag = _read_sidecar(ETAG_PATH)
+        lastmod = _read_sidecar(LASTMOD_PATH)
+        if etag:
+            headers["If-None-Match"] = etag
+        if lastmod:
+            headers["If-Modified-Since"] = lastmod
+
+    request = urllib.request.Request(url, headers=headers)
+    try:
+        with urllib.request.urlopen(request) as response:
+            html = response.read().decode('utf-8')
+            etag = response.headers.get("ETag", "")
+            lastmod = response.headers.get("Last-Modified", "")
+    except urllib.error.HTTPError as e:
+        if e.code != 304:
+            raise
+        html = HTML_PATH.read_text(encoding='utf-8')
+        print(f"Not modified: reusing {len(html)} characters from {HTML_PATH}")
+        return html
+
+    # Save raw HTML and its validators
+    CONTEXT_DIR.mkdir(exist_ok=True)
+    _write_atomic(HTML_PATH, html)
+    _write_atomic(ETAG_PATH, etag)
+    _write_atomic(LASTMOD_PATH, lastmod)
+
+    print(f"Extracted HTML: {len(html)} characters saved to {HTML_PATH}")
+    return html
 
 if __name__ == "__main__":
-    extract_gradio_html()
\ No newline at end of file
+    extract_gradio_html()
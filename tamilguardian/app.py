@@ -1,16 +1,29 @@
-import gradio as gr
 import asyncio
-from src.orchestrator.main import NammaLawOrchestrator
-from src.ui.interface import create_interface
-import os
+from contextlib import asynccontextmanager
 from dotenv import load_dotenv
 
 load_dotenv()
 
 def main():
     """Main entry point for NammaLaw AI application"""
+    # Imported lazily so the console entry point doesn't pay for gradio and
+    # the MCP stacks until the app is actually launched
+    from src.orchestrator.main import NammaLawOrchestrator
+    from src.ui.interface import create_interface
+    
     orchestrator = NammaLawOrchestrator()
     
+    @asynccontextmanager
+    async def lifespan(app):
+        # Runs on Gradio's serving loop, which owns the MCP processes and
+        # pooled connections. Warmup continues in the background so the UI
+        # is interactive at once; the first query awaits it.
+        startup = asyncio.ensure_future(orchestrator.start())
+        yield
+        startup.cancel()
+        await asyncio.gather(startup, return_exceptions=True)
+        await orchestrator.aclose()
+    
     # Create Gradio interface
     interface = create_interface(orchestrator)
     
@@ -18,7 +31,8 @@ def main():
     interface.launch(
         server_name="127.0.0.1",
         server_port=7860,
-        share=False
+        share=False,
+        app_kwargs={"lifespan": lifespan}
     )
 
 if __name__ == "__main__":
@@ -1,6 +1,7 @@
 import os
+from functools import lru_cache
 from typing import Dict, Any
-from pydantic import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 class Settings(BaseSettings):
     """Application settings"""
@@ -22,6 +23,12 @@ class Settings(BaseSettings):
     max_tokens: int = 4000
     confidence_threshold: float = 0.7
     
+    # Answer cache
+    answer_cache_enabled: bool = True
+    answer_cache_path: str = os.path.join(os.path.dirname(__file__), "..", "data", "answer_cache.db")
+    answer_cache_ttl: int = 86400
+    semantic_cache_threshold: float = 0.92
+    
     # Security
     secret_key: str = ""
     encryption_key: str = ""
@@ -33,12 +40,18 @@ class Settings(BaseSettings):
     parser_server_url: str = "http://localhost:8004"
     elevenlabs_server_url: str = "http://localhost:8005"
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = False
+    # Maximum pooled connections per MCP server origin
+    conn_pool_max_size: int = 8
+    
+    model_config = SettingsConfigDict(env_file=".env", case_sensitive=False, extra="ignore")
+
+@lru_cache
+def get_settings() -> Settings:
+    """Return the process-wide settings, parsing the environment once"""
+    return Settings()
 
 # Global settings instance
-settings = Settings()
+settings = get_settings()
 
 # Logging configuration
 LOGGING_CONFIG = {
@@ -6,13 +6,15 @@ setup(
     description="AI Legal Assistant for Tamil Nadu",
     author="TamilGuardian Team",
     packages=find_packages(),
-    python_requires=">=3.8",
+    python_requires=">=3.10",
     install_requires=[
         "gradio>=4.44.0",
         "fastapi>=0.104.1",
         "pydantic>=2.5.0",
+        "pydantic-settings>=2.0.0",
         "python-dotenv>=1.0.0",
-        "httpx>=0.25.2",
+        "httpx[http2]>=0.25.2",
+        "aiofiles>=23.1.0",
         "openai>=1.3.7",
         "sentence-transformers>=2.2.2",
         "faiss-cpu>=1.7.4",
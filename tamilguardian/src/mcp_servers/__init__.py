@@ -1,6 +1,25 @@
 """Official MCP servers integration for NammaLaw AI"""
 
-from .base import MCPServerManager
-from .official_mcp import mcp_client, setup_official_servers
+import importlib
 
-__all__ = ["MCPServerManager", "mcp_client", "setup_official_servers"]
\ No newline at end of file
+# Attributes are resolved on first access (PEP 562) so importing the package
+# doesn't pull in httpx or the official MCP client until they are needed
+_LAZY_ATTRS = {
+    "MCPServerManager": ".base",
+    "TransportPool": ".base",
+    "mcp_client": ".official_mcp",
+    "setup_official_servers": ".official_mcp",
+}
+
+__all__ = ["MCPServerManager", "TransportPool", "mcp_client", "setup_official_servers"]
+
+def __getattr__(name):
+    if name in _LAZY_ATTRS:
+        module = importlib.import_module(_LAZY_ATTRS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
\ No newline at end of file
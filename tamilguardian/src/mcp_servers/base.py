@@ -2,17 +2,58 @@ import asyncio
 import httpx
 from typing import Dict, Any, Optional
 from abc import ABC, abstractmethod
+from config.settings import settings
+from .codec import dumps, loads
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Seconds to wait for a single server before reporting it unhealthy
+HEALTH_CHECK_TIMEOUT = 2.0
+
+# Failures worth retrying: the server may answer if asked again
+TRANSIENT_ERRORS = (asyncio.TimeoutError, ConnectionError, httpx.TransportError)
+
+class TransportPool:
+    """Process-wide HTTP connection pools, one bounded client per MCP server origin"""
+    
+    _clients: Dict[str, httpx.AsyncClient] = {}
+    
+    @classmethod
+    def get_client(cls, base_url: str) -> httpx.AsyncClient:
+        """Return the pooled client for base_url's origin, creating it on first use"""
+        url = httpx.URL(base_url)
+        origin = f"{url.scheme}://{url.netloc.decode('ascii')}"
+        client = cls._clients.get(origin)
+        if client is None or client.is_closed:
+            pool_size = settings.conn_pool_max_size
+            client = httpx.AsyncClient(
+                http2=True,
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=pool_size,
+                    max_keepalive_connections=pool_size,
+                    keepalive_expiry=60.0
+                )
+            )
+            cls._clients[origin] = client
+        return client
+    
+    @classmethod
+    async def aclose(cls):
+        """Close every pooled client and release their connections"""
+        clients = list(cls._clients.values())
+        cls._clients.clear()
+        for client in clients:
+            await client.aclose()
+
 class BaseMCPServer(ABC):
     """Base class for all MCP servers"""
     
-    def __init__(self, name: str, base_url: str):
+    def __init__(self, name: str, base_url: str, client: Optional[httpx.AsyncClient] = None):
         self.name = name
         self.base_url = base_url
-        self.client = httpx.AsyncClient(timeout=30.0)
+        self.client = client or TransportPool.get_client(base_url)
     
     @abstractmethod
     async def health_check(self) -> Dict[str, str]:
@@ -24,10 +65,11 @@ class BaseMCPServer(ABC):
         try:
             response = await self.client.post(
                 f"{self.base_url}/tools/{tool_name}",
-                json=params
+                content=dumps(params),
+                headers={"Content-Type": "application/json"}
             )
             response.raise_for_status()
-            return response.json()
+            return loads(response.content)
         except Exception as e:
             logger.error(f"Error calling {self.name}.{tool_name}: {e}")
             raise
@@ -37,11 +79,33 @@ class MCPServerManager:
     
     def __init__(self):
         self.servers: Dict[str, BaseMCPServer] = {}
+        self._warmups: Dict[str, asyncio.Future] = {}
+        self._startup: Optional[asyncio.Future] = None
         self._initialize_servers()
+        
+        # Kick off slow server loading now if a loop is running; otherwise
+        # it starts on the first call
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            self._start_warmup()
+    
+    async def __aenter__(self):
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.aclose()
+    
+    async def aclose(self):
+        """Stop official MCP processes and release the shared HTTP connection pool"""
+        await self.mcp_client.disconnect_all()
+        await TransportPool.aclose()
     
     def _initialize_servers(self):
         """Initialize MCP server connections"""
-        from .official_mcp import mcp_client, setup_official_servers
+        from .official_mcp import mcp_client
         from .rag.server import RAGMCPServer
         
         # Primary: Custom RAG for TN legal data
@@ -51,34 +115,83 @@ class MCPServerManager:
         
         # Official MCP client (fallback)
         self.mcp_client = mcp_client
+    
+    async def start(self):
+        """Register official MCP servers and finish warmup; concurrent callers share one startup"""
+        if self._startup is None:
+            self._startup = asyncio.ensure_future(self._start())
+        startup = self._startup
+        try:
+            # Shielded so a cancelled caller doesn't abort startup for everyone else
+            await asyncio.shield(startup)
+        finally:
+            failed = startup.done() and (startup.cancelled() or startup.exception() is not None)
+            if failed and self._startup is startup:
+                self._startup = None
+    
+    async def _start(self):
+        from .official_mcp import setup_official_servers
         
-        # Setup official servers
-        asyncio.create_task(setup_official_servers())
+        await setup_official_servers()
+        self._start_warmup()
+        await asyncio.gather(*(self._await_warmup(name) for name in self.servers))
+    
+    def _start_warmup(self):
+        """Schedule warmup() on every server that defines one and isn't already warming up"""
+        for name, server in self.servers.items():
+            if name not in self._warmups and hasattr(server, "warmup"):
+                self._warmups[name] = asyncio.ensure_future(server.warmup())
+    
+    async def _await_warmup(self, name: str):
+        """Wait for one server's warmup; a failed warmup is retried on the next call"""
+        if name not in self._warmups:
+            self._start_warmup()
+        warmup = self._warmups.get(name)
+        if warmup is None:
+            return
+        try:
+            # Shielded so a cancelled caller doesn't cancel warmup for everyone else
+            await asyncio.shield(warmup)
+        finally:
+            failed = warmup.done() and (warmup.cancelled() or warmup.exception() is not None)
+            if failed and self._warmups.get(name) is warmup:
+                del self._warmups[name]
     
     async def call_server(self, server_name: str, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Call a tool on a specific server"""
         if server_name not in self.servers:
             raise ValueError(f"Unknown server: {server_name}")
         
+        await self._await_warmup(server_name)
+        
         server = self.servers[server_name]
         return await server.call_tool(tool_name, params)
     
+    async def _ping(self, name: str) -> str:
+        """Health status of one server, bounded by HEALTH_CHECK_TIMEOUT"""
+        try:
+            health = await asyncio.wait_for(
+                self.servers[name].health_check(),
+                timeout=HEALTH_CHECK_TIMEOUT
+            )
+        except asyncio.TimeoutError:
+            return "error: timed out"
+        except Exception as e:
+            return f"error: {str(e)}"
+        return health.get("status", "unknown")
+    
     async def health_check_all(self) -> Dict[str, str]:
-        """Check health of all servers"""
-        results = {}
-        for name, server in self.servers.items():
-            try:
-                health = await server.health_check()
-                results[name] = health.get("status", "unknown")
-            except Exception as e:
-                results[name] = f"error: {str(e)}"
-        
-        return results
+        """Check health of all servers concurrently"""
+        names = list(self.servers)
+        statuses = await asyncio.gather(*(self._ping(name) for name in names))
+        return dict(zip(names, statuses))
     
     async def call_mcp_tool(self, server: str, tool: str, params: dict) -> dict:
         """Call official MCP tool"""
+        await self.start()
         return await self.mcp_client.call_tool(server, tool, params)
     
     async def list_mcp_tools(self, server: str) -> dict:
         """List tools for MCP server"""
+        await self.start()
         return await self.mcp_client.list_tools(server)
\ No newline at end of file
@@ -0,0 +1,18 @@
+"""JSON encoding for MCP traffic, using orjson when it is installed"""
+
+try:
+    import orjson
+    
+    def dumps(obj) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes"""
+        return orjson.dumps(obj)
+    
+    loads = orjson.loads
+except ImportError:
+    import json
+    
+    def dumps(obj) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes"""
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    
+    loads = json.loads
\ No newline at end of file
@@ -1,80 +1,163 @@
 """Official MCP server integration using subprocess"""
 
 import asyncio
-import subprocess
-import json
 import os
 import logging
+from .codec import dumps, loads
 
 logger = logging.getLogger(__name__)
 
 class OfficialMCPClient:
-    """Simple client for official MCP servers using subprocess"""
+    """Simple client for official MCP servers using long-lived subprocesses"""
+    
+    PROTOCOL_VERSION = "2024-11-05"
+    # Seconds allowed for startup and for each tool call
+    CALL_TIMEOUT = 30.0
     
     def __init__(self):
         self.servers = {}
     
     async def connect_server(self, name: str, command: list, env: dict = None):
-        """Register server command"""
+        """Register server command; re-registering keeps or stops the running process"""
+        env = env or {}
+        existing = self.servers.get(name)
+        if existing is not None:
+            if existing["command"] == command and existing["extra_env"] == env:
+                return True
+            # The command changed, so don't leave the old process orphaned
+            async with existing["lock"]:
+                await self._stop(existing)
+        
         self.servers[name] = {
             "command": command,
-            "env": {**os.environ, **(env or {})}
+            "extra_env": env,
+            "env": {**os.environ, **env},
+            "process": None,
+            "lock": asyncio.Lock(),
+            "next_id": 1
         }
         logger.info(f"Registered {name} MCP server")
         return True
     
+    def _next_id(self, server: dict) -> int:
+        request_id = server["next_id"]
+        server["next_id"] += 1
+        return request_id
+    
+    async def _send(self, process, message: dict):
+        process.stdin.write(dumps(message) + b"\n")
+        await process.stdin.drain()
+    
+    async def _read_response(self, process, request_id: int) -> dict:
+        """Read line-delimited JSON-RPC messages until the reply to request_id"""
+        while True:
+            line = await process.stdout.readline()
+            if not line:
+                raise ConnectionError("Server process closed its output")
+            message = loads(line)
+            # Skip notifications and server-to-client requests, whose ids come
+            # from the server's own sequence and can collide with ours
+            if "method" in message:
+                continue
+            if message.get("id") == request_id and ("result" in message or "error" in message):
+                return message
+    
+    async def _ensure_started(self, server: dict):
+        """Launch the server process and run the MCP handshake once; caller holds the lock"""
+        process = server["process"]
+        if process is not None and process.returncode is None:
+            return process
+        
+        process = await asyncio.create_subprocess_exec(
+            *server["command"],
+            stdin=asyncio.subprocess.PIPE,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.DEVNULL,
+            env=server["env"]
+        )
+        server["process"] = process
+        
+        request_id = self._next_id(server)
+        await self._send(process, {
+            "jsonrpc": "2.0",
+            "id": request_id,
+            "method": "initialize",
+            "params": {
+                "protocolVersion": self.PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "nammalaw-ai", "version": "1.0.0"}
+            }
+        })
+        response = await self._read_response(process, request_id)
+        if "error" in response:
+            raise ConnectionError(f"Initialize failed: {response['error']}")
+        await self._send(process, {"jsonrpc": "2.0", "method": "notifications/initialized"})
+        
+        return process
+    
+    async def _stop(self, server: dict):
+        """Close a server process, killing it if it doesn't exit promptly"""
+        process, server["process"] = server["process"], None
+        if process is None or process.returncode is not None:
+            return
+        try:
+            process.stdin.close()
+            await asyncio.wait_for(process.wait(), timeout=5.0)
+        except asyncio.TimeoutError:
+            process.kill()
+            await process.wait()
+        except (ProcessLookupError, RuntimeError):
+            pass
+    
     async def call_tool(self, server_name: str, tool_name: str, arguments: dict):
-        """Call tool via subprocess"""
+        """Call tool on the server's persistent process"""
         if server_name not in self.servers:
             return {"error": f"Server {server_name} not registered"}
         
         server = self.servers[server_name]
         
-        try:
-            # Create MCP request
-            request = {
-                "jsonrpc": "2.0",
-                "id": 1,
-                "method": "tools/call",
-                "params": {
-                    "name": tool_name,
-                    "arguments": arguments
+        async with server["lock"]:
+            try:
+                process = await asyncio.wait_for(self._ensure_started(server), timeout=self.CALL_TIMEOUT)
+                
+                # Create MCP request
+                request_id = self._next_id(server)
+                request = {
+                    "jsonrpc": "2.0",
+                    "id": request_id,
+                    "method": "tools/call",
+                    "params": {
+                        "name": tool_name,
+                        "arguments": arguments
+                    }
                 }
-            }
-            
-            # Run server process
-            process = await asyncio.create_subprocess_exec(
-                *server["command"],
-                stdin=asyncio.subprocess.PIPE,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=server["env"]
-            )
-            
-            # Send request
-            request_json = json.dumps(request) + "\n"
-            stdout, stderr = await asyncio.wait_for(
-                process.communicate(request_json.encode()),
-                timeout=30.0
-            )
-            
-            if process.returncode != 0:
-                return {"error": f"Process failed: {stderr.decode()}", "success": False}
-            
-            # Parse response
-            if stdout:
-                response = json.loads(stdout.decode().strip())
-                if "error" in response:
-                    return {"error": response["error"], "success": False}
-                return {"result": response.get("result"), "success": True}
-            
-            return {"error": "No response", "success": False}
-            
-        except asyncio.TimeoutError:
-            return {"error": "Request timeout", "success": False}
-        except Exception as e:
-            logger.error(f"Tool call failed: {e}")
-            return {"error": str(e), "success": False}
+                
+                await self._send(process, request)
+                response = await asyncio.wait_for(
+                    self._read_response(process, request_id),
+                    timeout=self.CALL_TIMEOUT
+                )
+                
+            except asyncio.TimeoutError:
+                # The reply may still arrive later and desync the pipe
+                await self._stop(server)
+                return {"error": "Request timeout", "success": False}
+            except Exception as e:
+                logger.error(f"Tool call failed: {e}")
+                await self._stop(server)
+                return {"error": str(e), "success": False}
+        
+        if "error" in response:
+            return {"error": response["error"], "success": False}
+        return {"result": response.get("result"), "success": True}
+    
+    async def disconnect_all(self):
+        """Shut down every running server process"""
+        for server in self.servers.values():
+            if server["process"] is None:
+                continue
+            async with server["lock"]:
+                await self._stop(server)
     
     async def list_tools(self, server_name: str):
         """List available tools"""
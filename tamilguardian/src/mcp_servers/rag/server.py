@@ -1,8 +1,9 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 from ..base import BaseMCPServer
+import asyncio
 import os
+import re
 import logging
-import glob
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
@@ -14,14 +15,37 @@ class RAGMCPServer(BaseMCPServer):
         super().__init__("rag", "http://localhost:8001")
         self.legal_docs_path = os.path.join(os.path.dirname(__file__), "../../..", "data", "legal_docs")
         self.embeddings_path = os.path.join(os.path.dirname(__file__), "../../..", "data", "embeddings")
-        self._load_documents()
+        self.documents = []
+        self._title_index = []
+        self._loaded = False
+        self._loading: Optional[asyncio.Future] = None
+        
+    async def warmup(self):
+        """Load legal documents off the event loop once; concurrent callers share the load"""
+        if self._loaded:
+            return
+        if self._loading is None:
+            self._loading = asyncio.get_running_loop().run_in_executor(None, self._load_documents)
+        loading = self._loading
+        try:
+            # Shielded so a cancelled caller doesn't abort loading for everyone else
+            await asyncio.shield(loading)
+        finally:
+            failed = loading.done() and (loading.cancelled() or loading.exception() is not None)
+            if failed and self._loading is loading:
+                self._loading = None
+        self._loaded = True
         
     async def health_check(self) -> Dict[str, str]:
         """Check RAG server health"""
+        if not self._loaded:
+            return {"status": "loading", "service": "rag"}
         return {"status": "healthy", "service": "rag"}
     
     async def call_tool(self, tool_name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle RAG tool calls"""
+        # The first call pays the loading cost if warmup hasn't run yet
+        await self.warmup()
         
         if tool_name == "search":
             return await self._search(params)
@@ -34,16 +58,25 @@ class RAGMCPServer(BaseMCPServer):
     
     def _load_documents(self):
         """Load available legal documents"""
-        self.documents = []
-        if os.path.exists(self.legal_docs_path):
-            for file_path in glob.glob(os.path.join(self.legal_docs_path, "*.pdf")):
-                doc_name = Path(file_path).stem
-                self.documents.append({
-                    "id": doc_name,
-                    "title": doc_name.replace("_", " ").title(),
-                    "path": file_path,
-                    "type": "pdf"
+        documents = []
+        docs_dir = Path(self.legal_docs_path)
+        if docs_dir.is_dir():
+            for file_path in docs_dir.iterdir():
+                if file_path.suffix != ".pdf":
+                    continue
+                # Stat once here so retrieve never touches the filesystem
+                st = file_path.stat()
+                documents.append({
+                    "id": file_path.stem,
+                    "title": file_path.stem.replace("_", " ").title(),
+                    "path": str(file_path),
+                    "type": "pdf",
+                    "size": st.st_size,
+                    "mtime": st.st_mtime
                 })
+        # Lowercased titles are matched on every search, so compute them once
+        self._title_index = [(doc["title"].lower(), doc) for doc in documents]
+        self.documents = documents
     
     async def _search(self, params: Dict[str, Any]) -> Dict[str, Any]:
         """Search Tamil Nadu legal documents"""
@@ -53,11 +86,13 @@ class RAGMCPServer(BaseMCPServer):
             return {"success": False, "error": "No query provided"}
         
         try:
-            # Simple keyword matching in document titles
+            # Simple keyword matching in document titles: one alternation of
+            # all query keywords, so each title is scanned once
             results = []
-            for doc in self.documents:
-                title_lower = doc["title"].lower()
-                if any(keyword in title_lower for keyword in query.split()):
+            keywords = query.split()
+            keyword_re = re.compile("|".join(map(re.escape, keywords))) if keywords else None
+            for title_lower, doc in self._title_index:
+                if keyword_re and keyword_re.search(title_lower):
                     results.append({
                         "title": doc["title"],
                         "content": f"Document: {doc['title']}",
@@ -109,7 +144,7 @@ class RAGMCPServer(BaseMCPServer):
                 "type": doc["type"],
                 "metadata": {
                     "filename": os.path.basename(doc["path"]),
-                    "size": os.path.getsize(doc["path"]) if os.path.exists(doc["path"]) else 0
+                    "size": doc["size"]
                 }
             }
             
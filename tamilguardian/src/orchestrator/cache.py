@@ -0,0 +1,206 @@
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+from .models import ExecutionResult
+import logging
+
+logger = logging.getLogger(__name__)
+
+# Multilingual so Tamil and English phrasings of a question land close together
+EMBEDDING_MODEL = "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2"
+
+# Embeddings of recent missed lookups, kept so store() doesn't encode again
+MISS_EMBEDDINGS_SIZE = 64
+
+_embedder = None
+_embedder_lock = threading.Lock()
+
+def get_embedder():
+    """Process-wide sentence encoder, loaded once on first use"""
+    global _embedder
+    with _embedder_lock:
+        if _embedder is None:
+            from sentence_transformers import SentenceTransformer
+            _embedder = SentenceTransformer(EMBEDDING_MODEL)
+        return _embedder
+
+class SemanticAnswerCache:
+    """SQLite-backed answer cache looked up by sentence-embedding similarity"""
+    
+    def __init__(
+        self,
+        db_path: str,
+        threshold: float = 0.92,
+        ttl: int = 86400,
+        candidates: int = 5
+    ):
+        self.db_path = db_path
+        self.threshold = threshold
+        self.ttl = ttl
+        self.candidates = candidates
+        self._conn: Optional[sqlite3.Connection] = None
+        self._embedder = None
+        self._index = None
+        self._disabled = False
+        self._miss_embeddings: "OrderedDict[str, Any]" = OrderedDict()
+        # SQLite, FAISS and the encoder are used from executor threads
+        self._lock = threading.Lock()
+    
+    @property
+    def ready(self) -> bool:
+        """Whether warmup has loaded the encoder and index"""
+        return self._index is not None and not self._disabled
+    
+    async def warmup(self):
+        """Load the encoder and index; lookups and stores are skipped until this finishes"""
+        if self._disabled:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(None, self._warmup_sync)
+        except Exception as e:
+            self._disable(e)
+    
+    async def lookup(
+        self,
+        query: str,
+        preferences: Optional[Dict[str, Any]] = None
+    ) -> Optional[ExecutionResult]:
+        """Return a cached result for a near-identical query, if any"""
+        if not self.ready:
+            return None
+        loop = asyncio.get_running_loop()
+        try:
+            result_json = await loop.run_in_executor(
+                None, self._lookup_sync, query, self._preferences_key(preferences)
+            )
+        except Exception as e:
+            self._disable(e)
+            return None
+        
+        if result_json is None:
+            return None
+        return ExecutionResult.model_validate_json(result_json)
+    
+    async def store(
+        self,
+        query: str,
+        preferences: Optional[Dict[str, Any]],
+        result: ExecutionResult
+    ):
+        """Cache a successful result for later lookups"""
+        if not self.ready:
+            return
+        loop = asyncio.get_running_loop()
+        try:
+            await loop.run_in_executor(
+                None, self._store_sync, query, self._preferences_key(preferences), result.model_dump_json()
+            )
+        except Exception as e:
+            self._disable(e)
+    
+    def _disable(self, error: Exception):
+        """Stop using the cache after a failure so queries are never blocked by it"""
+        logger.warning(f"Answer cache disabled: {error}")
+        self._disabled = True
+    
+    @staticmethod
+    def _preferences_key(preferences: Optional[Dict[str, Any]]) -> str:
+        return json.dumps(preferences or {}, sort_keys=True)
+    
+    def _ensure_loaded(self):
+        """Open the database and rebuild the FAISS index from unexpired rows"""
+        if self._index is not None:
+            return
+        
+        # Heavy imports are deferred until the cache is first used
+        import faiss
+        import numpy as np
+        
+        self._embedder = get_embedder()
+        
+        self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS answer_cache (
+                id INTEGER PRIMARY KEY,
+                query TEXT NOT NULL,
+                preferences TEXT NOT NULL,
+                embedding BLOB NOT NULL,
+                result_json TEXT NOT NULL,
+                created_at REAL NOT NULL,
+                hits INTEGER NOT NULL DEFAULT 0
+            )
+        """)
+        self._conn.execute(
+            "DELETE FROM answer_cache WHERE created_at < ?",
+            (time.time() - self.ttl,)
+        )
+        self._conn.commit()
+        
+        dim = self._embedder.get_sentence_embedding_dimension()
+        index = faiss.IndexIDMap(faiss.IndexFlatIP(dim))
+        rows = self._conn.execute("SELECT id, embedding FROM answer_cache").fetchall()
+        if rows:
+            ids = np.array([row[0] for row in rows], dtype=np.int64)
+            embeddings = np.vstack([np.frombuffer(row[1], dtype=np.float32) for row in rows])
+            index.add_with_ids(embeddings, ids)
+        self._index = index
+    
+    def _encode(self, query: str):
+        """Unit-length embedding, so inner product is cosine similarity"""
+        return self._embedder.encode(
+            [query.strip()],
+            batch_size=32,
+            convert_to_numpy=True,
+            normalize_embeddings=True
+        ).astype("float32")
+    
+    def _warmup_sync(self):
+        with self._lock:
+            self._ensure_loaded()
+    
+    def _lookup_sync(self, query: str, preferences_key: str) -> Optional[str]:
+        with self._lock:
+            self._ensure_loaded()
+            embedding = self._encode(query)
+            
+            if self._index.ntotal:
+                scores, ids = self._index.search(embedding, self.candidates)
+                oldest = time.time() - self.ttl
+                for score, row_id in zip(scores[0], ids[0]):
+                    # Hits come back best first, so stop at the first weak one
+                    if row_id < 0 or score < self.threshold:
+                        break
+                    row = self._conn.execute(
+                        "SELECT result_json FROM answer_cache WHERE id = ? AND preferences = ? AND created_at >= ?",
+                        (int(row_id), preferences_key, oldest)
+                    ).fetchone()
+                    if row is not None:
+                        self._conn.execute("UPDATE answer_cache SET hits = hits + 1 WHERE id = ?", (int(row_id),))
+                        self._conn.commit()
+                        return row[0]
+            
+            # A miss is usually followed by store() for the same query
+            self._miss_embeddings[query.strip()] = embedding
+            if len(self._miss_embeddings) > MISS_EMBEDDINGS_SIZE:
+                self._miss_embeddings.popitem(last=False)
+            return None
+    
+    def _store_sync(self, query: str, preferences_key: str, result_json: str):
+        import numpy as np
+        
+        with self._lock:
+            self._ensure_loaded()
+            embedding = self._miss_embeddings.pop(query.strip(), None)
+            if embedding is None:
+                embedding = self._encode(query)
+            cursor = self._conn.execute(
+                "INSERT INTO answer_cache (query, preferences, embedding, result_json, created_at) VALUES (?, ?, ?, ?, ?)",
+                (query, preferences_key, embedding.tobytes(), result_json, time.time())
+            )
+            self._conn.commit()
+            self._index.add_with_ids(embedding, np.array([cursor.lastrowid], dtype=np.int64))
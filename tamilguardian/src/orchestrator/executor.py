@@ -1,14 +1,48 @@
 import asyncio
-from typing import Dict, Any
+import os
+import shutil
+import tempfile
+from itertools import islice
+from uuid import uuid4
+from typing import Awaitable, Callable, Dict, Any, Iterator, List, Optional
 from .models import TaskGraph, ExecutionResult, TaskType
-from ..mcp_servers.base import MCPServerManager
+from ..mcp_servers.base import MCPServerManager, TRANSIENT_ERRORS
 import logging
 
 logger = logging.getLogger(__name__)
 
+# RAG results are listed first, so they win when the cap is reached
+MAX_CITATIONS = 50
+
+# First retry waits this many seconds, doubling on each further attempt
+RETRY_BASE_DELAY = 0.2
+
 class TaskExecutor:
     """Executes task graphs with retry logic and error handling"""
     
+    def __init__(self):
+        # Narration files for this process, created on first use
+        self._audio_dir: Optional[str] = None
+        # Task type -> coroutine function(task, context, mcp_manager)
+        self._dispatch: Dict[TaskType, Callable[..., Awaitable[Dict[str, Any]]]] = {
+            TaskType.PARSE: lambda task, context, mcp: mcp.call_server(
+                "parser", "parse_documents", task.input_data
+            ),
+            TaskType.RAG_SEARCH: lambda task, context, mcp: mcp.call_server(
+                "rag", "search", task.input_data
+            ),
+            TaskType.WEB_SEARCH: lambda task, context, mcp: mcp.call_server(
+                "websearch", "search", task.input_data
+            ),
+            TaskType.LLM_REASONING: lambda task, context, mcp: mcp.call_server(
+                "llm", "reason", {**task.input_data, "context": context}
+            ),
+            TaskType.LLM_GENERATION: lambda task, context, mcp: mcp.call_server(
+                "llm", "generate", {**task.input_data, "context": context}
+            ),
+            TaskType.TTS: self._run_tts,
+        }
+    
     async def execute_graph(
         self,
         task_graph: TaskGraph,
@@ -28,25 +62,52 @@ class TaskExecutor:
         traces = []
         
         try:
-            # Execute tasks in dependency order
-            for task in task_graph.get_execution_order():
-                logger.info(f"Executing task: {task.id}")
+            # Validates the graph up front, so every pass below has a ready task
+            pending = task_graph.get_execution_order()
+            resolved = set()
+            
+            while pending:
+                ready = [task for task in pending if all(dep in resolved for dep in task.dependencies)]
+                ready_ids = {task.id for task in ready}
+                pending = [task for task in pending if task.id not in ready_ids]
                 
-                # Skip conditional tasks if conditions not met
-                if task.conditional and not self._should_execute_conditional(task, execution_context):
-                    continue
+                # Skip conditional tasks if conditions not met; they still
+                # count as resolved so their dependents can run
+                runnable = []
+                for task in ready:
+                    if task.conditional and not self._should_execute_conditional(task, execution_context):
+                        resolved.add(task.id)
+                    else:
+                        runnable.append(task)
                 
-                # Execute task
-                result = await self._execute_task(task, execution_context, mcp_manager)
-                execution_context[task.id] = result
+                # Independent tasks share no inputs, so run them concurrently
+                for task in runnable:
+                    logger.info(f"Executing task: {task.id}")
+                futures = [
+                    asyncio.ensure_future(self._execute_with_retry(task, execution_context, mcp_manager))
+                    for task in runnable
+                ]
+                try:
+                    results = await asyncio.gather(*futures)
+                except BaseException:
+                    # gather leaves the other tasks running; stop them before
+                    # the graph returns
+                    for future in futures:
+                        future.cancel()
+                    await asyncio.gather(*futures, return_exceptions=True)
+                    raise
                 
-                # Log trace
-                traces.append({
-                    "task_id": task.id,
-                    "task_type": task.type.value,
-                    "success": result.get("success", True),
-                    "metadata": result.get("metadata", {})
-                })
+                for task, result in zip(runnable, results):
+                    execution_context[task.id] = result
+                    resolved.add(task.id)
+                    
+                    # Log trace
+                    traces.append({
+                        "task_id": task.id,
+                        "task_type": task.type.value,
+                        "success": result.get("success", True),
+                        "metadata": result.get("metadata", {})
+                    })
             
             # Compile final result
             return self._compile_result(execution_context, traces)
@@ -59,6 +120,27 @@ class TaskExecutor:
                 traces=traces
             )
     
+    async def _execute_with_retry(
+        self,
+        task,
+        context: Dict[str, Any],
+        mcp_manager: MCPServerManager
+    ) -> Dict[str, Any]:
+        """Execute a task with a per-attempt timeout, retrying transient failures"""
+        attempts = max(1, task.retry_count)
+        for attempt in range(attempts):
+            try:
+                return await asyncio.wait_for(
+                    self._execute_task(task, context, mcp_manager),
+                    timeout=task.timeout
+                )
+            except TRANSIENT_ERRORS as e:
+                if attempt == attempts - 1:
+                    raise
+                delay = RETRY_BASE_DELAY * 2 ** attempt
+                logger.warning(f"Task {task.id} failed ({e!r}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+    
     async def _execute_task(
         self,
         task,
@@ -66,36 +148,38 @@ class TaskExecutor:
         mcp_manager: MCPServerManager
     ) -> Dict[str, Any]:
         """Execute a single task"""
-        
-        if task.type == TaskType.PARSE:
-            return await mcp_manager.call_server("parser", "parse_documents", task.input_data)
-        
-        elif task.type == TaskType.RAG_SEARCH:
-            return await mcp_manager.call_server("rag", "search", task.input_data)
-        
-        elif task.type == TaskType.WEB_SEARCH:
-            return await mcp_manager.call_server("websearch", "search", task.input_data)
-        
-        elif task.type == TaskType.LLM_REASONING:
-            return await mcp_manager.call_server("llm", "reason", {
-                **task.input_data,
-                "context": context
-            })
-        
-        elif task.type == TaskType.LLM_GENERATION:
-            return await mcp_manager.call_server("llm", "generate", {
-                **task.input_data,
-                "context": context
-            })
-        
-        elif task.type == TaskType.TTS:
-            return await mcp_manager.call_server("elevenlabs", "synthesize", {
-                "text": context.get("draft_documents", {}).get("content", ""),
-                **task.input_data
-            })
-        
-        else:
+        handler = self._dispatch.get(task.type)
+        if handler is None:
             raise ValueError(f"Unknown task type: {task.type}")
+        return await handler(task, context, mcp_manager)
+    
+    async def _run_tts(
+        self,
+        task,
+        context: Dict[str, Any],
+        mcp_manager: MCPServerManager
+    ) -> Dict[str, Any]:
+        """Synthesize the drafted document to an audio file"""
+        # The TTS server writes audio straight to this path, which Gradio can
+        # serve as a file, instead of passing MP3 bytes back through us
+        if self._audio_dir is None:
+            self._audio_dir = tempfile.mkdtemp(prefix="tg_audio_")
+        output_path = os.path.join(self._audio_dir, f"tg_{uuid4().hex}.mp3")
+        result = await mcp_manager.call_server("elevenlabs", "synthesize", {
+            "text": context.get("draft_documents", {}).get("content", ""),
+            "output_path": output_path,
+            **task.input_data
+        })
+        # Only report a file the server actually wrote
+        if result.get("success", True) and "audio_url" not in result and os.path.exists(output_path):
+            result["audio_url"] = output_path
+        return result
+    
+    def cleanup(self):
+        """Delete the narration files written by this executor"""
+        if self._audio_dir is not None:
+            shutil.rmtree(self._audio_dir, ignore_errors=True)
+            self._audio_dir = None
     
     def _should_execute_conditional(self, task, context: Dict[str, Any]) -> bool:
         """Determine if conditional task should execute"""
@@ -109,12 +193,18 @@ class TaskExecutor:
     def _compile_result(self, context: Dict[str, Any], traces: List[Dict]) -> ExecutionResult:
         """Compile final execution result"""
         
+        # Bind each task output once; skipped or empty tasks yield {}
+        reasoning = context.get("llm_reasoning") or {}
+        generated_options = context.get("generate_options") or {}
+        drafts = context.get("draft_documents") or {}
+        narration = context.get("tts_narration") or {}
+        
         # Extract key outputs
-        summary = context.get("llm_reasoning", {}).get("summary", "")
-        options = context.get("generate_options", {}).get("options", [])
-        draft = context.get("draft_documents", {}).get("content", "")
+        summary = reasoning.get("summary", "")
+        options = generated_options.get("options", [])
+        draft = drafts.get("content", "")
         citations = self._extract_citations(context)
-        audio_url = context.get("tts_narration", {}).get("audio_url")
+        audio_url = narration.get("audio_url")
         
         return ExecutionResult(
             success=True,
@@ -127,17 +217,12 @@ class TaskExecutor:
         )
     
     def _extract_citations(self, context: Dict[str, Any]) -> List[Dict[str, str]]:
-        """Extract citations from context"""
-        citations = []
-        
-        # From RAG results
-        rag_result = context.get("rag_retrieval", {})
-        if "sources" in rag_result:
-            citations.extend(rag_result["sources"])
-        
-        # From web search results
-        web_result = context.get("web_search", {})
-        if "sources" in web_result:
-            citations.extend(web_result["sources"])
-        
-        return citations
\ No newline at end of file
+        """Extract citations from context, capped at MAX_CITATIONS"""
+        return list(islice(self._iter_sources(context), MAX_CITATIONS))
+    
+    def _iter_sources(self, context: Dict[str, Any]) -> Iterator[Dict[str, str]]:
+        """Yield sources from RAG results, then web search results"""
+        for task_id in ("rag_retrieval", "web_search"):
+            result = context.get(task_id)
+            if result:
+                yield from result.get("sources", ())
\ No newline at end of file
@@ -1,13 +1,21 @@
 import asyncio
-from typing import Dict, Any, List, Optional
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
 from .planner import TaskPlanner
 from .executor import TaskExecutor
 from .models import TaskGraph, ExecutionResult
+from .cache import SemanticAnswerCache
 from ..mcp_servers.base import MCPServerManager
+from config.settings import settings
 import logging
 
 logger = logging.getLogger(__name__)
 
+EXACT_CACHE_SIZE = 1024
+
 class NammaLawOrchestrator:
     """Central orchestrator for NammaLaw AI Legal Assistant"""
     
@@ -15,6 +23,35 @@ class NammaLawOrchestrator:
         self.planner = TaskPlanner()
         self.executor = TaskExecutor()
         self.mcp_manager = MCPServerManager()
+        self.answer_cache = SemanticAnswerCache(
+            settings.answer_cache_path,
+            threshold=settings.semantic_cache_threshold,
+            ttl=settings.answer_cache_ttl
+        ) if settings.answer_cache_enabled else None
+        self._startup: Optional[asyncio.Future] = None
+        self._cache_warmup: Optional[asyncio.Future] = None
+        # Key -> (stored at, result); shares the answer cache's switch and TTL
+        self._exact_cache: "OrderedDict[Tuple[str, str, str], Tuple[float, ExecutionResult]]" = OrderedDict()
+    
+    async def start(self):
+        """Bring up MCP servers and the answer cache; concurrent callers share one startup"""
+        if self._startup is None:
+            self._startup = asyncio.ensure_future(self._start())
+        startup = self._startup
+        try:
+            # Shielded so a cancelled query doesn't abort startup for everyone else
+            await asyncio.shield(startup)
+        finally:
+            failed = startup.done() and (startup.cancelled() or startup.exception() is not None)
+            if failed and self._startup is startup:
+                self._startup = None
+    
+    async def _start(self):
+        # Loading the encoder can take minutes, so it runs in the background
+        # and queries skip the semantic cache until it is ready
+        if self.answer_cache is not None and self._cache_warmup is None:
+            self._cache_warmup = asyncio.ensure_future(self.answer_cache.warmup())
+        await self.mcp_manager.start()
         
     async def process_legal_query(
         self, 
@@ -33,7 +70,26 @@ class NammaLawOrchestrator:
         Returns:
             ExecutionResult with summary, options, drafts, and citations
         """
+        # Exact repeats (e.g. resubmitting an example) skip even the embedding
+        exact_key = self._exact_key(query, documents, user_preferences)
+        cached = self._recall(exact_key)
+        if cached is not None:
+            return cached
+        
+        # Answers depend on uploaded documents, so only document-free queries
+        # go through the semantic cache
+        use_cache = self.answer_cache is not None and not documents
+        
         try:
+            # The first query waits for MCP servers still warming up
+            await self.start()
+            
+            if use_cache:
+                cached = await self.answer_cache.lookup(query, user_preferences)
+                if cached is not None:
+                    self._remember(exact_key, cached)
+                    return cached
+            
             # Step 1: Create task graph
             task_graph = await self.planner.create_task_graph(
                 query=query,
@@ -47,6 +103,15 @@ class NammaLawOrchestrator:
                 mcp_manager=self.mcp_manager
             )
             
+            # A failed task still compiles to success=True with empty fields,
+            # so only cache answers where every task succeeded
+            if result.success and all(trace["success"] for trace in result.traces):
+                self._remember(exact_key, result)
+                # Narration files are deleted at shutdown, so answers that
+                # point at one aren't persisted
+                if use_cache and not result.audio_url:
+                    await self.answer_cache.store(query, user_preferences, result)
+            
             return result
             
         except Exception as e:
@@ -57,6 +122,55 @@ class NammaLawOrchestrator:
                 summary="An error occurred while processing your request."
             )
     
+    @staticmethod
+    def _exact_key(
+        query: str,
+        documents: Optional[List[bytes]],
+        user_preferences: Optional[Dict[str, Any]]
+    ) -> Tuple[str, str, str]:
+        """Normalized query, digest of uploaded documents and canonical preferences"""
+        digest = hashlib.blake2b()
+        for document in documents or []:
+            # Length prefix keeps [b"ab"] and [b"a", b"b"] distinct
+            digest.update(len(document).to_bytes(8, "little"))
+            digest.update(document)
+        return (
+            query.strip().lower(),
+            digest.hexdigest(),
+            json.dumps(user_preferences or {}, sort_keys=True)
+        )
+    
+    def _recall(self, key: Tuple[str, str, str]) -> Optional[ExecutionResult]:
+        """Copy of an unexpired exact-match entry, so callers can't mutate the cached one"""
+        if not settings.answer_cache_enabled:
+            return None
+        entry = self._exact_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, result = entry
+        if time.monotonic() - stored_at > settings.answer_cache_ttl:
+            del self._exact_cache[key]
+            return None
+        self._exact_cache.move_to_end(key)
+        return result.model_copy(deep=True)
+    
+    def _remember(self, key: Tuple[str, str, str], result: ExecutionResult):
+        """Insert into the exact-match cache, evicting the least recently used entry"""
+        if not settings.answer_cache_enabled:
+            return
+        self._exact_cache[key] = (time.monotonic(), result.model_copy(deep=True))
+        self._exact_cache.move_to_end(key)
+        if len(self._exact_cache) > EXACT_CACHE_SIZE:
+            self._exact_cache.popitem(last=False)
+    
+    async def aclose(self):
+        """Stop MCP server processes, release pooled connections and delete narration files"""
+        if self._cache_warmup is not None:
+            self._cache_warmup.cancel()
+            await asyncio.gather(self._cache_warmup, return_exceptions=True)
+        await self.mcp_manager.aclose()
+        self.executor.cleanup()
+    
     async def health_check(self) -> Dict[str, str]:
         """Check health of all MCP servers"""
         return await self.mcp_manager.health_check_all()
\ No newline at end of file
@@ -1,5 +1,7 @@
-from pydantic import BaseModel
+from pydantic import BaseModel, PrivateAttr
 from typing import List, Dict, Any, Optional
+from collections import deque
+from dataclasses import dataclass, field
 from enum import Enum
 
 class TaskType(Enum):
@@ -12,37 +14,57 @@ class TaskType(Enum):
     CONNECTOR = "connector"
     SAFETY_CHECK = "safety_check"
 
-class Task(BaseModel):
+@dataclass(slots=True)
+class Task:
     id: str
     type: TaskType
     input_data: Dict[str, Any]
-    dependencies: List[str] = []
+    dependencies: List[str] = field(default_factory=list)
     conditional: bool = False
     retry_count: int = 3
+    timeout: float = 60.0
 
 class TaskGraph(BaseModel):
     tasks: List[Task]
+    _order: Optional[List[Task]] = PrivateAttr(default=None)
+    _by_id: Optional[Dict[str, Task]] = PrivateAttr(default=None)
+    
+    def get_task(self, task_id: str) -> Optional[Task]:
+        """Look up a task by id in O(1)"""
+        if self._by_id is None:
+            self._by_id = {task.id: task for task in self.tasks}
+        return self._by_id.get(task_id)
     
     def get_execution_order(self) -> List[Task]:
         """Return tasks in dependency-resolved order"""
-        executed = set()
-        ordered_tasks = []
+        # Graphs are built once by the planner, so the order is computed once
+        if self._order is None:
+            self._order = self._topological_sort()
+        return list(self._order)
+    
+    def _topological_sort(self) -> List[Task]:
+        """Kahn's algorithm: O(tasks + dependencies)"""
+        indegree = {task.id: len(task.dependencies) for task in self.tasks}
+        dependents: Dict[str, List[str]] = {task.id: [] for task in self.tasks}
+        for task in self.tasks:
+            for dep in task.dependencies:
+                if dep in dependents:
+                    dependents[dep].append(task.id)
         
-        def can_execute(task: Task) -> bool:
-            return all(dep in executed for dep in task.dependencies)
+        ready = deque(task.id for task in self.tasks if indegree[task.id] == 0)
+        ordered_tasks = []
         
-        remaining_tasks = self.tasks.copy()
+        while ready:
+            task_id = ready.popleft()
+            ordered_tasks.append(self.get_task(task_id))
+            for dependent in dependents[task_id]:
+                indegree[dependent] -= 1
+                if indegree[dependent] == 0:
+                    ready.append(dependent)
         
-        while remaining_tasks:
-            ready_tasks = [task for task in remaining_tasks if can_execute(task)]
-            
-            if not ready_tasks:
-                raise ValueError("Circular dependency detected in task graph")
-            
-            for task in ready_tasks:
-                ordered_tasks.append(task)
-                executed.add(task.id)
-                remaining_tasks.remove(task)
+        # Tasks left over sit on a cycle or depend on a task that isn't in the graph
+        if len(ordered_tasks) != len(self.tasks):
+            raise ValueError("Circular dependency detected in task graph")
         
         return ordered_tasks
 
@@ -1,12 +1,33 @@
-from typing import Dict, Any, List, Optional
+from dataclasses import replace
+from typing import Dict, Any, List, Optional, Tuple
 from .models import TaskGraph, Task, TaskType
 import logging
 
 logger = logging.getLogger(__name__)
 
+class _Slot:
+    """Placeholder in template input_data, filled in per request"""
+    
+    def __init__(self, name: str):
+        self.name = name
+
+_QUERY = _Slot("query")
+_DOCUMENTS = _Slot("documents")
+
 class TaskPlanner:
     """Plans execution tasks based on user input and requirements"""
     
+    def __init__(self):
+        # The graph shape only depends on these flags, so build each shape once
+        self._templates: Dict[Tuple[bool, bool, bool], List[Task]] = {
+            (has_documents, enable_audio, web_fallback): self._build_template(
+                has_documents, enable_audio, web_fallback
+            )
+            for has_documents in (False, True)
+            for enable_audio in (False, True)
+            for web_fallback in (False, True)
+        }
+    
     async def create_task_graph(
         self,
         query: str,
@@ -24,40 +45,70 @@ class TaskPlanner:
         Returns:
             TaskGraph with ordered execution steps
         """
+        preferences = preferences or {}
+        key = (
+            bool(documents),
+            bool(preferences.get("enable_audio", False)),
+            not preferences.get("disable_web_fallback", False)
+        )
+        values = {"query": query, "documents": documents}
+        
+        tasks = [
+            replace(
+                task,
+                input_data={
+                    name: values[value.name] if isinstance(value, _Slot) else value
+                    for name, value in task.input_data.items()
+                },
+                dependencies=list(task.dependencies)
+            )
+            for task in self._templates[key]
+        ]
+        
+        return TaskGraph(tasks=tasks)
+    
+    def _build_template(self, has_documents: bool, enable_audio: bool, web_fallback: bool) -> List[Task]:
+        """Build the task list for one combination of planning flags"""
         tasks = []
         
         # Step 1: Parse documents if provided
-        if documents:
+        if has_documents:
             tasks.append(Task(
                 id="parse_documents",
                 type=TaskType.PARSE,
-                input_data={"documents": documents},
+                input_data={"documents": _DOCUMENTS},
                 dependencies=[]
             ))
         
-        # Step 2: RAG retrieval
+        # Step 2: RAG retrieval (only needs the query, so it can overlap parsing)
         tasks.append(Task(
             id="rag_retrieval",
             type=TaskType.RAG_SEARCH,
-            input_data={"query": query},
-            dependencies=["parse_documents"] if documents else []
+            input_data={"query": _QUERY},
+            dependencies=[]
         ))
         
-        # Step 3: Web search fallback (conditional)
-        tasks.append(Task(
-            id="web_search",
-            type=TaskType.WEB_SEARCH,
-            input_data={"query": query},
-            dependencies=["rag_retrieval"],
-            conditional=True
-        ))
+        # Step 3: Web search fallback (conditional), left out entirely when
+        # disabled so the executor never has to consider it
+        if web_fallback:
+            tasks.append(Task(
+                id="web_search",
+                type=TaskType.WEB_SEARCH,
+                input_data={"query": _QUERY},
+                dependencies=["rag_retrieval"],
+                conditional=True
+            ))
         
         # Step 4: LLM reasoning and summary
         tasks.append(Task(
             id="llm_reasoning",
             type=TaskType.LLM_REASONING,
-            input_data={"query": query},
-            dependencies=["rag_retrieval", "web_search"]
+            input_data={"query": _QUERY},
+            dependencies=(
+                (["parse_documents"] if has_documents else [])
+                + ["rag_retrieval"]
+                + (["web_search"] if web_fallback else [])
+            )
         ))
         
         # Step 5: Generate legal options
@@ -77,7 +128,7 @@ class TaskPlanner:
         ))
         
         # Step 7: TTS narration (optional)
-        if preferences and preferences.get("enable_audio", False):
+        if enable_audio:
             tasks.append(Task(
                 id="tts_narration",
                 type=TaskType.TTS,
@@ -85,4 +136,4 @@ class TaskPlanner:
                 dependencies=["draft_documents"]
             ))
         
-        return TaskGraph(tasks=tasks)
\ No newline at end of file
+        return tasks
\ No newline at end of file
@@ -1,11 +1,17 @@
 import gradio as gr
 import asyncio
+import aiofiles
 from typing import Optional, List
 from ..orchestrator.main import NammaLawOrchestrator
 import logging
 
 logger = logging.getLogger(__name__)
 
+async def _read_upload(path: str) -> bytes:
+    """Read an uploaded file without blocking the event loop"""
+    async with aiofiles.open(path, 'rb') as f:
+        return await f.read()
+
 def create_interface(orchestrator: NammaLawOrchestrator) -> gr.Blocks:
     """Create the main Gradio interface for TamilGuardian"""
     
@@ -23,12 +29,10 @@ def create_interface(orchestrator: NammaLawOrchestrator) -> gr.Blocks:
                 "language": language
             }
             
-            # Process documents if uploaded
+            # Process documents if uploaded, reading them concurrently
             doc_bytes = []
             if documents:
-                for doc in documents:
-                    with open(doc.name, 'rb') as f:
-                        doc_bytes.append(f.read())
+                doc_bytes = list(await asyncio.gather(*(_read_upload(doc.name) for doc in documents)))
             
             # Process the query
             result = await orchestrator.process_legal_query(
@@ -43,31 +47,31 @@ def create_interface(orchestrator: NammaLawOrchestrator) -> gr.Blocks:
             # Format response
             summary = result.summary or "No summary available"
             
-            # Format legal options
+            # Format legal options; parts are joined once instead of growing a string
             options_text = ""
             if result.legal_options:
-                options_text = "## Legal Options:\n\n"
+                parts = ["## Legal Options:\n\n"]
                 for i, option in enumerate(result.legal_options, 1):
-                    options_text += f"### Option {i}: {option.title}\n"
-                    options_text += f"{option.description}\n\n"
+                    parts.append(f"### Option {i}: {option.title}\n{option.description}\n\n")
                     if option.steps:
-                        options_text += "**Steps:**\n"
-                        for step in option.steps:
-                            options_text += f"- {step}\n"
+                        parts.append("**Steps:**\n")
+                        parts.extend(f"- {step}\n" for step in option.steps)
                     if option.estimated_cost:
-                        options_text += f"**Estimated Cost:** {option.estimated_cost}\n"
+                        parts.append(f"**Estimated Cost:** {option.estimated_cost}\n")
                     if option.timeline:
-                        options_text += f"**Timeline:** {option.timeline}\n"
-                    options_text += "\n---\n\n"
+                        parts.append(f"**Timeline:** {option.timeline}\n")
+                    parts.append("\n---\n\n")
+                options_text = "".join(parts)
             
             # Format citations
             citations_text = ""
             if result.citations:
-                citations_text = "## Sources:\n\n"
-                for citation in result.citations:
-                    citations_text += f"- **{citation.title}** ({citation.jurisdiction})\n"
-                    citations_text += f"  Source: {citation.source_type} | Confidence: {citation.confidence:.2f}\n"
-                    citations_text += f"  Excerpt: {citation.excerpt}\n\n"
+                citations_text = "## Sources:\n\n" + "".join(
+                    f"- **{citation.title}** ({citation.jurisdiction})\n"
+                    f"  Source: {citation.source_type} | Confidence: {citation.confidence:.2f}\n"
+                    f"  Excerpt: {citation.excerpt}\n\n"
+                    for citation in result.citations
+                )
             
             # Draft document
             draft = result.draft_document or "No draft generated"
@@ -176,13 +180,10 @@ def create_interface(orchestrator: NammaLawOrchestrator) -> gr.Blocks:
             label="Click on any example to try it"
         )
         
-        # Event handlers
-        def sync_process_query(*args):
-            """Synchronous wrapper for async query processing"""
-            return asyncio.run(process_query(*args))
-        
+        # Event handlers: Gradio awaits async handlers on its own event loop,
+        # so pooled connections and caches survive between submissions
         submit_btn.click(
-            fn=sync_process_query,
+            fn=process_query,
             inputs=[query_input, documents_input, enable_audio, language],
             outputs=[summary_output, options_output, citations_output, draft_output, audio_output],
             api_visibility="public"
@@ -0,0 +1,34 @@
+"""Minimal line-delimited JSON-RPC MCP server used by test_official_mcp"""
+
+import json
+import os
+import sys
+
+def send(message):
+    sys.stdout.write(json.dumps(message) + "\n")
+    sys.stdout.flush()
+
+for line in sys.stdin:
+    request = json.loads(line)
+    if "id" not in request:
+        continue
+    if request["method"] == "initialize":
+        send({"jsonrpc": "2.0", "id": request["id"], "result": {"protocolVersion": "2024-11-05"}})
+        continue
+    
+    tool = request["params"]["name"]
+    if tool == "hang":
+        continue
+    if tool == "fail":
+        send({"jsonrpc": "2.0", "id": request["id"], "error": {"code": -32000, "message": "tool failed"}})
+        continue
+    
+    # Interleave a notification, and a server request reusing the client's
+    # id, to check the client skips both
+    send({"jsonrpc": "2.0", "method": "notifications/message", "params": {"level": "info"}})
+    send({"jsonrpc": "2.0", "id": request["id"], "method": "roots/list"})
+    send({
+        "jsonrpc": "2.0",
+        "id": request["id"],
+        "result": {"pid": os.getpid(), "arguments": request["params"]["arguments"]}
+    })
@@ -0,0 +1,108 @@
+import pytest
+import numpy as np
+from src.orchestrator import cache
+from src.orchestrator.cache import SemanticAnswerCache
+from src.orchestrator.models import ExecutionResult
+
+# Unit vectors standing in for sentence embeddings
+VECTORS = {
+    "deposit not returned": [1.0, 0.0, 0.0],
+    "landlord kept my deposit": [0.99, 0.141, 0.0],
+    "wrong traffic challan": [0.0, 0.0, 1.0],
+}
+
+class StubEmbedder:
+    """Looks queries up in VECTORS instead of running a model"""
+    
+    encoded = []
+    
+    def get_sentence_embedding_dimension(self):
+        return 3
+    
+    def encode(self, sentences, **kwargs):
+        self.encoded.extend(sentences)
+        vectors = np.array([VECTORS[sentence] for sentence in sentences], dtype=np.float32)
+        return vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+@pytest.fixture(autouse=True)
+def stub_embedder(monkeypatch):
+    monkeypatch.setattr(StubEmbedder, "encoded", [])
+    monkeypatch.setattr(cache, "get_embedder", StubEmbedder)
+
+@pytest.fixture
+def db_path(tmp_path):
+    return str(tmp_path / "answer_cache.db")
+
+def _result(summary):
+    return ExecutionResult(success=True, summary=summary)
+
+async def _warm_cache(db_path, **kwargs):
+    answers = SemanticAnswerCache(db_path, **kwargs)
+    await answers.warmup()
+    return answers
+
+@pytest.mark.asyncio
+async def test_similar_query_hits_and_unrelated_query_misses(db_path):
+    """Lookups match by embedding similarity, not exact text"""
+    answers = await _warm_cache(db_path, threshold=0.9)
+    await answers.store("deposit not returned", {}, _result("Claim the deposit"))
+    
+    hit = await answers.lookup("landlord kept my deposit", {})
+    
+    assert hit.summary == "Claim the deposit"
+    assert await answers.lookup("wrong traffic challan", {}) is None
+
+@pytest.mark.asyncio
+async def test_preferences_must_match(db_path):
+    """An answer cached for one set of preferences isn't reused for another"""
+    answers = await _warm_cache(db_path)
+    await answers.store("deposit not returned", {"language": "Tamil"}, _result("Tamil answer"))
+    
+    assert await answers.lookup("deposit not returned", {"language": "English"}) is None
+    assert (await answers.lookup("deposit not returned", {"language": "Tamil"})).summary == "Tamil answer"
+
+@pytest.mark.asyncio
+async def test_answers_persist_until_ttl(db_path):
+    """A fresh cache reloads stored answers from SQLite, dropping expired ones"""
+    await (await _warm_cache(db_path)).store("deposit not returned", {}, _result("Claim the deposit"))
+    
+    reloaded = await (await _warm_cache(db_path)).lookup("deposit not returned", {})
+    expired = await (await _warm_cache(db_path, ttl=-1)).lookup("deposit not returned", {})
+    
+    assert reloaded.summary == "Claim the deposit"
+    assert expired is None
+
+@pytest.mark.asyncio
+async def test_failure_disables_cache(db_path, monkeypatch):
+    """An error inside the cache turns it off instead of failing the query"""
+    def broken_embedder():
+        raise ImportError("sentence_transformers is not installed")
+    monkeypatch.setattr(cache, "get_embedder", broken_embedder)
+    answers = await _warm_cache(db_path)
+    
+    assert not answers.ready
+    assert await answers.lookup("deposit not returned", {}) is None
+    await answers.store("deposit not returned", {}, _result("Claim the deposit"))
+
+@pytest.mark.asyncio
+async def test_cache_is_skipped_until_warm(db_path, monkeypatch):
+    """Queries arriving before warmup neither wait for the encoder nor load it"""
+    def unexpected_load():
+        raise AssertionError("encoder loaded outside warmup")
+    monkeypatch.setattr(cache, "get_embedder", unexpected_load)
+    answers = SemanticAnswerCache(db_path)
+    
+    await answers.store("deposit not returned", {}, _result("Claim the deposit"))
+    
+    assert await answers.lookup("deposit not returned", {}) is None
+
+@pytest.mark.asyncio
+async def test_miss_then_store_encodes_once(db_path):
+    """store() reuses the embedding computed by the lookup that missed"""
+    answers = await _warm_cache(db_path)
+    
+    assert await answers.lookup("deposit not returned", {}) is None
+    await answers.store("deposit not returned", {}, _result("Claim the deposit"))
+    
+    assert StubEmbedder.encoded == ["deposit not returned"]
+    assert (await answers.lookup("landlord kept my deposit", {})).summary == "Claim the deposit"
@@ -0,0 +1,165 @@
+import pytest
+import asyncio
+import os
+from src.orchestrator import executor
+from src.orchestrator.executor import TaskExecutor
+from src.orchestrator.models import Task, TaskGraph, TaskType
+
+class FakeMCPManager:
+    """Records calls and how many were in flight at once"""
+    
+    def __init__(self, responses=None):
+        self.responses = responses or {}
+        self.calls = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+    
+    async def call_server(self, server_name, tool_name, params):
+        self.calls.append((server_name, tool_name))
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return self.responses.get((server_name, tool_name), {"success": True})
+
+@pytest.mark.asyncio
+async def test_independent_tasks_run_concurrently():
+    """Tasks with no dependency between them are dispatched together"""
+    graph = TaskGraph(tasks=[
+        Task(id="parse_documents", type=TaskType.PARSE, input_data={}),
+        Task(id="rag_retrieval", type=TaskType.RAG_SEARCH, input_data={"query": "q"}),
+        Task(
+            id="llm_reasoning",
+            type=TaskType.LLM_REASONING,
+            input_data={"query": "q"},
+            dependencies=["parse_documents", "rag_retrieval"]
+        ),
+    ])
+    manager = FakeMCPManager()
+    
+    result = await TaskExecutor().execute_graph(graph, manager)
+    
+    assert result.success
+    assert manager.max_in_flight == 2
+    assert manager.calls[-1] == ("llm", "reason")
+
+@pytest.mark.asyncio
+async def test_skipped_conditional_task_unblocks_dependents():
+    """A skipped web search must not stall tasks that depend on it"""
+    graph = TaskGraph(tasks=[
+        Task(id="rag_retrieval", type=TaskType.RAG_SEARCH, input_data={"query": "q"}),
+        Task(
+            id="web_search",
+            type=TaskType.WEB_SEARCH,
+            input_data={"query": "q"},
+            dependencies=["rag_retrieval"],
+            conditional=True
+        ),
+        Task(
+            id="llm_reasoning",
+            type=TaskType.LLM_REASONING,
+            input_data={"query": "q"},
+            dependencies=["rag_retrieval", "web_search"]
+        ),
+    ])
+    manager = FakeMCPManager({("rag", "search"): {"success": True, "confidence": 0.9}})
+    
+    result = await TaskExecutor().execute_graph(graph, manager)
+    
+    assert result.success
+    assert manager.calls == [("rag", "search"), ("llm", "reason")]
+    assert [trace["task_id"] for trace in result.traces] == ["rag_retrieval", "llm_reasoning"]
+
+
+class FlakyMCPManager(FakeMCPManager):
+    """Drops the connection on the first call"""
+    
+    async def call_server(self, server_name, tool_name, params):
+        if not self.calls:
+            self.calls.append((server_name, tool_name))
+            raise ConnectionError("connection reset")
+        return await super().call_server(server_name, tool_name, params)
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_retried(monkeypatch):
+    """A dropped connection is retried instead of failing the graph"""
+    monkeypatch.setattr(executor, "RETRY_BASE_DELAY", 0)
+    graph = TaskGraph(tasks=[Task(id="rag_retrieval", type=TaskType.RAG_SEARCH, input_data={})])
+    manager = FlakyMCPManager()
+    
+    result = await TaskExecutor().execute_graph(graph, manager)
+    
+    assert result.success
+    assert manager.calls == [("rag", "search"), ("rag", "search")]
+
+@pytest.mark.asyncio
+async def test_retries_are_bounded_by_retry_count(monkeypatch):
+    """Once retries are exhausted the graph reports the failure"""
+    monkeypatch.setattr(executor, "RETRY_BASE_DELAY", 0)
+    graph = TaskGraph(tasks=[
+        Task(id="rag_retrieval", type=TaskType.RAG_SEARCH, input_data={}, retry_count=1)
+    ])
+    
+    result = await TaskExecutor().execute_graph(graph, FlakyMCPManager())
+    
+    assert not result.success
+    assert "connection reset" in result.error
+
+class FailingParserManager(FakeMCPManager):
+    """Fails document parsing at once while RAG search is still running"""
+    
+    def __init__(self):
+        super().__init__()
+        self.finished = []
+    
+    async def call_server(self, server_name, tool_name, params):
+        if server_name == "parser":
+            raise ValueError("unreadable document")
+        await asyncio.sleep(0.2)
+        self.finished.append(server_name)
+        return {"success": True}
+
+@pytest.mark.asyncio
+async def test_failure_cancels_concurrent_tasks():
+    """Sibling tasks don't keep running after the graph has failed"""
+    graph = TaskGraph(tasks=[
+        Task(id="parse_documents", type=TaskType.PARSE, input_data={}),
+        Task(id="rag_retrieval", type=TaskType.RAG_SEARCH, input_data={"query": "q"}),
+    ])
+    manager = FailingParserManager()
+    
+    result = await TaskExecutor().execute_graph(graph, manager)
+    await asyncio.sleep(0.3)
+    
+    assert not result.success
+    assert manager.finished == []
+
+class TTSManager(FakeMCPManager):
+    """Writes the narration file only when asked to"""
+    
+    def __init__(self, write_audio):
+        super().__init__()
+        self.write_audio = write_audio
+    
+    async def call_server(self, server_name, tool_name, params):
+        if self.write_audio:
+            with open(params["output_path"], "wb") as f:
+                f.write(b"ID3")
+        return {"success": True}
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("write_audio", [True, False])
+async def test_tts_reports_only_written_audio(write_audio):
+    """audio_url is set only when the server wrote the file, and cleanup removes it"""
+    graph = TaskGraph(tasks=[Task(id="tts_narration", type=TaskType.TTS, input_data={})])
+    task_executor = TaskExecutor()
+    
+    result = await task_executor.execute_graph(graph, TTSManager(write_audio))
+    
+    assert result.success
+    if write_audio:
+        assert os.path.exists(result.audio_url)
+        task_executor.cleanup()
+        assert not os.path.exists(result.audio_url)
+    else:
+        assert result.audio_url is None
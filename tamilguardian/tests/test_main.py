@@ -0,0 +1,112 @@
+import pytest
+import asyncio
+from config.settings import settings
+from src.orchestrator.main import NammaLawOrchestrator
+
+class StubMCPManager:
+    """Answers every tool call successfully and counts the calls"""
+    
+    def __init__(self, responses=None):
+        self.responses = responses or {}
+        self.calls = 0
+        self.starts = 0
+    
+    async def start(self):
+        self.starts += 1
+        await asyncio.sleep(0.01)
+    
+    async def aclose(self):
+        pass
+    
+    async def call_server(self, server_name, tool_name, params):
+        self.calls += 1
+        return self.responses.get((server_name, tool_name), {"success": True, "summary": "Tenant rights"})
+
+@pytest.fixture
+def orchestrator():
+    orchestrator = NammaLawOrchestrator()
+    orchestrator.mcp_manager = StubMCPManager()
+    orchestrator.answer_cache = None
+    return orchestrator
+
+@pytest.mark.asyncio
+async def test_exact_repeat_is_served_from_memory(orchestrator):
+    """A repeated query skips the MCP servers and returns its own copy"""
+    first = await orchestrator.process_legal_query("Deposit not returned")
+    calls = orchestrator.mcp_manager.calls
+    first.summary = "changed by caller"
+    
+    second = await orchestrator.process_legal_query("  deposit not returned ")
+    
+    assert orchestrator.mcp_manager.calls == calls
+    assert second.summary == "Tenant rights"
+    assert second is not await orchestrator.process_legal_query("Deposit not returned")
+
+@pytest.mark.asyncio
+async def test_exact_cache_follows_answer_cache_setting(orchestrator, monkeypatch):
+    """Disabling the answer cache disables the in-memory cache too"""
+    monkeypatch.setattr(settings, "answer_cache_enabled", False)
+    
+    await orchestrator.process_legal_query("Deposit not returned")
+    calls = orchestrator.mcp_manager.calls
+    await orchestrator.process_legal_query("Deposit not returned")
+    
+    assert orchestrator.mcp_manager.calls == 2 * calls
+
+@pytest.mark.asyncio
+async def test_exact_cache_entries_expire(orchestrator, monkeypatch):
+    """Entries older than the answer cache TTL are recomputed"""
+    monkeypatch.setattr(settings, "answer_cache_ttl", -1)
+    
+    await orchestrator.process_legal_query("Deposit not returned")
+    calls = orchestrator.mcp_manager.calls
+    await orchestrator.process_legal_query("Deposit not returned")
+    
+    assert orchestrator.mcp_manager.calls == 2 * calls
+
+@pytest.mark.asyncio
+async def test_results_with_failed_tasks_are_not_cached(orchestrator):
+    """A degraded answer is recomputed rather than served from cache"""
+    orchestrator.mcp_manager = StubMCPManager({("llm", "reason"): {"success": False}})
+    
+    result = await orchestrator.process_legal_query("Deposit not returned")
+    calls = orchestrator.mcp_manager.calls
+    await orchestrator.process_legal_query("Deposit not returned")
+    
+    assert result.success
+    assert orchestrator.mcp_manager.calls == 2 * calls
+
+@pytest.mark.asyncio
+async def test_first_queries_share_one_startup(orchestrator):
+    """Queries arriving during startup wait for it instead of starting it again"""
+    results = await asyncio.gather(
+        orchestrator.process_legal_query("Deposit not returned"),
+        orchestrator.process_legal_query("Wrong traffic challan")
+    )
+    
+    assert all(result.success for result in results)
+    assert orchestrator.mcp_manager.starts == 1
+
+class StalledAnswerCache:
+    """An answer cache whose encoder never finishes loading"""
+    
+    ready = False
+    
+    async def warmup(self):
+        await asyncio.Event().wait()
+    
+    async def lookup(self, query, preferences):
+        return None
+    
+    async def store(self, query, preferences, result):
+        pass
+
+@pytest.mark.asyncio
+async def test_queries_do_not_wait_for_cache_warmup(orchestrator):
+    """Only MCP startup blocks a query; the semantic cache warms up in the background"""
+    orchestrator.answer_cache = StalledAnswerCache()
+    
+    result = await asyncio.wait_for(orchestrator.process_legal_query("Deposit not returned"), timeout=1)
+    await orchestrator.aclose()
+    
+    assert result.success
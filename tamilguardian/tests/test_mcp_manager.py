@@ -0,0 +1,75 @@
+import pytest
+import asyncio
+from src.mcp_servers import official_mcp
+from src.mcp_servers.base import MCPServerManager
+
+class SlowWarmupServer:
+    """Warms up slowly, optionally failing the first attempt"""
+    
+    def __init__(self, fail_first=False):
+        self.fail_first = fail_first
+        self.warmups = 0
+        self.loaded = False
+    
+    async def warmup(self):
+        self.warmups += 1
+        await asyncio.sleep(0.1)
+        if self.fail_first and self.warmups == 1:
+            raise OSError("documents unavailable")
+        self.loaded = True
+    
+    async def health_check(self):
+        return {"status": "healthy" if self.loaded else "loading"}
+    
+    async def call_tool(self, tool_name, params):
+        return {"success": True, "tool": tool_name}
+
+@pytest.fixture
+def make_manager(monkeypatch):
+    def make(**servers):
+        def initialize(self):
+            self.servers = servers
+        monkeypatch.setattr(MCPServerManager, "_initialize_servers", initialize)
+        return MCPServerManager()
+    return make
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_does_not_cancel_warmup(make_manager):
+    """A caller timing out during warmup leaves warmup running for everyone else"""
+    server = SlowWarmupServer()
+    manager = make_manager(rag=server)
+    
+    with pytest.raises(asyncio.TimeoutError):
+        await asyncio.wait_for(manager.call_server("rag", "search", {}), timeout=0.01)
+    
+    assert await manager.call_server("rag", "search", {}) == {"success": True, "tool": "search"}
+    assert await manager.health_check_all() == {"rag": "healthy"}
+    assert server.warmups == 1
+
+@pytest.mark.asyncio
+async def test_failed_warmup_is_retried_and_isolated(make_manager):
+    """A failed warmup only affects its own server and is retried on the next call"""
+    flaky = SlowWarmupServer(fail_first=True)
+    manager = make_manager(rag=flaky, other=SlowWarmupServer())
+    
+    with pytest.raises(OSError):
+        await manager.call_server("rag", "search", {})
+    assert await manager.call_server("other", "search", {}) == {"success": True, "tool": "search"}
+    
+    assert await manager.call_server("rag", "search", {}) == {"success": True, "tool": "search"}
+    assert flaky.warmups == 2
+
+@pytest.mark.asyncio
+async def test_concurrent_starts_share_one_setup(make_manager, monkeypatch):
+    """Overlapping start() calls register the official servers only once"""
+    setups = []
+    async def setup_official_servers():
+        setups.append(1)
+        await asyncio.sleep(0.05)
+    monkeypatch.setattr(official_mcp, "setup_official_servers", setup_official_servers)
+    manager = make_manager(rag=SlowWarmupServer())
+    
+    await asyncio.gather(manager.start(), manager.start())
+    await manager.start()
+    
+    assert len(setups) == 1
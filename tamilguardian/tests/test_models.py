@@ -0,0 +1,35 @@
+import pytest
+from src.orchestrator.models import Task, TaskGraph, TaskType
+
+def _task(task_id, *dependencies):
+    return Task(id=task_id, type=TaskType.RAG_SEARCH, input_data={}, dependencies=list(dependencies))
+
+def test_execution_order_respects_dependencies():
+    """Every task comes after the tasks it depends on"""
+    graph = TaskGraph(tasks=[
+        _task("draft", "options"),
+        _task("options", "reason"),
+        _task("rag"),
+        _task("reason", "rag", "parse"),
+        _task("parse"),
+    ])
+    
+    order = [task.id for task in graph.get_execution_order()]
+    
+    assert order == ["rag", "parse", "reason", "options", "draft"]
+
+def test_execution_order_detects_cycles():
+    """Cycles and missing dependencies are rejected"""
+    with pytest.raises(ValueError):
+        TaskGraph(tasks=[_task("a", "b"), _task("b", "a")]).get_execution_order()
+    
+    with pytest.raises(ValueError):
+        TaskGraph(tasks=[_task("a", "missing")]).get_execution_order()
+
+
+def test_get_task_by_id():
+    """Tasks can be looked up by id"""
+    graph = TaskGraph(tasks=[_task("rag"), _task("reason", "rag")])
+    
+    assert graph.get_task("reason").dependencies == ["rag"]
+    assert graph.get_task("missing") is None
@@ -0,0 +1,81 @@
+import pytest
+import pytest_asyncio
+import asyncio
+import os
+import sys
+from src.mcp_servers.official_mcp import OfficialMCPClient
+
+FAKE_SERVER = os.path.join(os.path.dirname(__file__), "fake_mcp_server.py")
+
+@pytest_asyncio.fixture
+async def client():
+    client = OfficialMCPClient()
+    await client.connect_server("fake", [sys.executable, FAKE_SERVER])
+    yield client
+    await client.disconnect_all()
+
+@pytest.mark.asyncio
+async def test_process_is_reused_across_calls(client):
+    """Calls after the first go to the same process without a new handshake"""
+    first = await client.call_tool("fake", "echo", {"n": 1})
+    second = await client.call_tool("fake", "echo", {"n": 2})
+    
+    assert first == {"result": {"pid": first["result"]["pid"], "arguments": {"n": 1}}, "success": True}
+    assert second["result"]["pid"] == first["result"]["pid"]
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_get_their_own_replies(client):
+    """Each call gets its own reply, never a notification or a server request reusing its id"""
+    results = await asyncio.gather(*(client.call_tool("fake", "echo", {"n": n}) for n in range(5)))
+    
+    assert [result["result"]["arguments"] for result in results] == [{"n": n} for n in range(5)]
+    assert len({result["result"]["pid"] for result in results}) == 1
+
+@pytest.mark.asyncio
+async def test_error_reply_is_reported(client):
+    result = await client.call_tool("fake", "fail", {})
+    
+    assert result["success"] is False
+    assert result["error"]["message"] == "tool failed"
+
+@pytest.mark.asyncio
+async def test_timeout_restarts_process(client, monkeypatch):
+    """A timed-out call stops the process so a late reply can't desync the next call"""
+    monkeypatch.setattr(OfficialMCPClient, "CALL_TIMEOUT", 0.5)
+    before = await client.call_tool("fake", "echo", {})
+    process = client.servers["fake"]["process"]
+    
+    timed_out = await client.call_tool("fake", "hang", {})
+    after = await client.call_tool("fake", "echo", {"n": 1})
+    
+    assert timed_out == {"error": "Request timeout", "success": False}
+    assert process.returncode is not None
+    assert after["result"]["pid"] != before["result"]["pid"]
+    assert after["result"]["arguments"] == {"n": 1}
+
+@pytest.mark.asyncio
+async def test_disconnect_all_stops_processes(client):
+    await client.call_tool("fake", "echo", {})
+    process = client.servers["fake"]["process"]
+    
+    await client.disconnect_all()
+    
+    assert process.returncode is not None
+    assert client.servers["fake"]["process"] is None
+
+@pytest.mark.asyncio
+async def test_unregistered_server(client):
+    assert await client.call_tool("missing", "echo", {}) == {"error": "Server missing not registered"}
+
+@pytest.mark.asyncio
+async def test_reregistering_does_not_orphan_process(client):
+    """Registering a name again keeps its process, or stops it if the command changed"""
+    first = await client.call_tool("fake", "echo", {})
+    await client.connect_server("fake", [sys.executable, FAKE_SERVER])
+    same = await client.call_tool("fake", "echo", {})
+    process = client.servers["fake"]["process"]
+    
+    await client.connect_server("fake", [sys.executable, "-u", FAKE_SERVER])
+    
+    assert same["result"]["pid"] == first["result"]["pid"]
+    assert process.returncode is not None
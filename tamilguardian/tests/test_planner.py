@@ -0,0 +1,43 @@
+import pytest
+from src.orchestrator.planner import TaskPlanner
+
+@pytest.mark.asyncio
+async def test_planner_fills_template_per_request():
+    """Graphs built from the same template don't share request data"""
+    planner = TaskPlanner()
+    
+    first = await planner.create_task_graph("tenant rights", documents=[b"lease"])
+    second = await planner.create_task_graph("overtime wages")
+    
+    first_tasks = {task.id: task for task in first.tasks}
+    second_tasks = {task.id: task for task in second.tasks}
+    assert first_tasks["parse_documents"].input_data == {"documents": [b"lease"]}
+    assert first_tasks["rag_retrieval"].input_data == {"query": "tenant rights"}
+    assert second_tasks["rag_retrieval"].input_data == {"query": "overtime wages"}
+    assert "parse_documents" not in second_tasks
+    assert "parse_documents" in first_tasks["llm_reasoning"].dependencies
+    assert "parse_documents" not in second_tasks["llm_reasoning"].dependencies
+
+@pytest.mark.asyncio
+async def test_planner_adds_tts_only_when_audio_enabled():
+    """TTS narration is planned only when requested"""
+    planner = TaskPlanner()
+    
+    with_audio = await planner.create_task_graph("q", preferences={"enable_audio": True})
+    without_audio = await planner.create_task_graph("q", preferences={"enable_audio": False})
+    
+    assert with_audio.tasks[-1].id == "tts_narration"
+    assert all(task.id != "tts_narration" for task in without_audio.tasks)
+
+
+@pytest.mark.asyncio
+async def test_planner_omits_disabled_web_fallback():
+    """Disabling the web fallback drops the task and the dependency on it"""
+    planner = TaskPlanner()
+    
+    graph = await planner.create_task_graph("q", preferences={"disable_web_fallback": True})
+    tasks = {task.id: task for task in graph.tasks}
+    
+    assert "web_search" not in tasks
+    assert tasks["llm_reasoning"].dependencies == ["rag_retrieval"]
+    assert [task.id for task in graph.get_execution_order()][0] == "rag_retrieval"
@@ -0,0 +1,37 @@
+import pytest
+import asyncio
+from src.mcp_servers.rag.server import RAGMCPServer
+
+@pytest.fixture
+def server(tmp_path):
+    for name in ("supreme_court_judgment", "tenancy_act", "notes"):
+        (tmp_path / f"{name}.pdf").write_bytes(b"%PDF-1.4")
+    (tmp_path / "readme.txt").write_text("not a pdf")
+    server = RAGMCPServer()
+    server.legal_docs_path = str(tmp_path)
+    return server
+
+@pytest.mark.asyncio
+async def test_first_call_loads_documents(server):
+    """Calling the server directly, without warmup, still sees the documents"""
+    assert (await server.health_check())["status"] == "loading"
+    
+    result = await server.call_tool("search", {"query": "Supreme Court"})
+    
+    assert result["total_docs"] == 3
+    assert [doc["source"] for doc in result["results"]] == ["supreme_court_judgment"]
+    assert (await server.health_check())["status"] == "healthy"
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_load_once(server, monkeypatch):
+    loads = []
+    load_documents = server._load_documents
+    def counting_load():
+        loads.append(1)
+        load_documents()
+    monkeypatch.setattr(server, "_load_documents", counting_load)
+    
+    results = await asyncio.gather(*(server.call_tool("list_documents", {}) for _ in range(3)))
+    
+    assert [result["count"] for result in results] == [3, 3, 3]
+    assert len(loads) == 1